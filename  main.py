@@ -1,111 +1,282 @@
-import requests
+import asyncio
+import hishel
+import httpx
+import msgspec
+import redis
+import tenacity
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import defaultdict, deque
+from pathlib import Path
 import csv
+import heapq
+import logging
+import os
 
+log = logging.getLogger(__name__)
 
-def get_ryanair_flights(origin_iata, start_date, end_date, currency):
+MAX_WORKERS = 16
+MAX_CONNECTIONS = 32
+FARES_CACHE_TTL = 600
+RETURN_CACHE_TTL = 600
+MIN_LAYOVER = timedelta(hours=4)
+MAX_RESULTS = 200
+MAX_ATTEMPTS = 3
+# Kept well beyond the Redis TTLs, so responses are still around to be
+# revalidated upstream once the Redis entry has expired
+HTTP_CACHE_TTL = 86400
+HTTP_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "hishel"
+
+HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
+
+_client = hishel.CacheClient(
+    storage=hishel.FileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL),
+    http2=True,
+    timeout=10.0,
+    headers=HEADERS
+)
+
+_redis = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+
+
+def _is_retryable(exc):
+    """
+    Returns True for errors worth retrying: connection problems, timeouts, 429s and 5xx responses.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+_retry = tenacity.retry(
+    stop=tenacity.stop_after_attempt(MAX_ATTEMPTS),
+    wait=tenacity.wait_exponential(multiplier=1, max=8),
+    retry=tenacity.retry_if_exception(_is_retryable),
+    reraise=True
+)
+
+
+class Airport(msgspec.Struct):
+    """An airport as it appears in a Ryanair fare."""
+    iataCode: str
+    name: str
+
+
+class Price(msgspec.Struct):
+    """The price of a Ryanair fare."""
+    value: float
+    currencyCode: str
+
+
+class Outbound(msgspec.Struct):
+    """The flight details of a Ryanair fare."""
+    departureAirport: Airport
+    arrivalAirport: Airport
+    departureDate: datetime
+    arrivalDate: datetime
+    price: Price
+
+
+class Fare(msgspec.Struct):
+    """A one-way Ryanair fare."""
+    outbound: Outbound
+
+
+class FareResponse(msgspec.Struct):
+    """The body of a Ryanair oneWayFares response."""
+    fares: list[Fare] = []
+
+
+def cached_get_json(key, ttl, fetch_fn, decode_type=list[Fare]):
+    """
+    Returns a JSON value from the Redis cache, fetching and storing it on a miss.
+
+    Parameters:
+        key (str): Redis key the value is cached under.
+        ttl (int): Time to live of a newly cached value, in seconds.
+        fetch_fn (callable): Called with no arguments on a cache miss. Should return
+                             a value msgspec can encode, or None if it must not be cached.
+        decode_type (type): Type a cached value is decoded into.
+
+    Returns:
+        The cached or freshly fetched value, or None if `fetch_fn` returned None.
+
+    Notes:
+        - Exceptions raised by `fetch_fn` propagate and nothing is cached.
+        - If Redis is unavailable the value is simply fetched every time. This fallback only
+          covers fare lookups; app.py needs Redis to store search results.
+    """
+    value = _cache_get(key, decode_type)
+    if value is not None:
+        return value
+
+    value = fetch_fn()
+    _cache_set(key, ttl, value)
+    return value
+
+
+async def cached_get_json_async(key, ttl, fetch_fn, decode_type=list[Fare]):
+    """
+    Async counterpart of `cached_get_json`, where `fetch_fn` is a coroutine function.
+
+    The Redis calls run in a worker thread so they don't block the event loop.
+    """
+    value = await asyncio.to_thread(_cache_get, key, decode_type)
+    if value is not None:
+        return value
+
+    value = await fetch_fn()
+    await asyncio.to_thread(_cache_set, key, ttl, value)
+    return value
+
+
+def _cache_get(key, decode_type):
+    """
+    Returns the value cached under `key` decoded as `decode_type`, or None on a miss or Redis error.
+    """
+    try:
+        blob = _redis.get(key)
+    except redis.RedisError:
+        return None
+    return None if blob is None else msgspec.json.decode(blob, type=decode_type)
+
+
+def _cache_set(key, ttl, value):
+    """
+    Caches `value` under `key` for `ttl` seconds, unless it is None.
+    """
+    if value is None:
+        return
+    try:
+        _redis.setex(key, ttl, msgspec.json.encode(value))
+    except redis.RedisError:
+        pass
+
+
+def get_ryanair_day_fares(origin_iata, date_str, currency):
+    """
+    Fetch the one-way Ryanair fares from a given origin airport departing on a single day.
+
+    Results are cached in Redis for `FARES_CACHE_TTL` seconds.
+
+    Args:
+        origin_iata (str): IATA code of the origin airport (e.g., "STN").
+        date_str (str): Departure date in "YYYY-MM-DD" format.
+        currency (str): Currency code the fares are cached under.
+
+    Returns:
+        list of Fare: The fares returned by the Ryanair API.
+
+    Raises:
+        httpx.HTTPError: If the API request fails. Connection errors, 429s and 5xx
+                         responses are first retried with exponential backoff,
+                         up to `MAX_ATTEMPTS` attempts.
+    """
+    url = "https://www.ryanair.com/api/farfnd/v4/oneWayFares"
+    params = {
+        "departureAirportIataCode": origin_iata,
+        "outboundDepartureDateFrom": date_str,
+        "outboundDepartureDateTo": date_str,
+        "market": "en-gb"
+    }
+
+    @_retry
+    def fetch():
+        response = _client.get(url, params=params)
+        response.raise_for_status()
+        return msgspec.json.decode(response.content, type=FareResponse).fares
+
+    key = f"rya:day:{origin_iata}:{date_str}:{currency}"
+    return cached_get_json(key, FARES_CACHE_TTL, fetch)
+
+
+def get_ryanair_flights(origin_iata, start_date, end_date, currency, max_workers=MAX_WORKERS):
     """
     Fetch the cheapest one-way Ryanair fares from a given origin airport 
     for all destinations within a specified date range.
 
     This function queries the Ryanair public API for each day between 
-    `start_date` and `end_date` and returns a list of fares, as this returns more results.
+    `start_date` and `end_date` and yields the fares, as this returns more results.
+    The per-day lookups (see `get_ryanair_day_fares`) are issued concurrently on a
+    thread pool sharing one pooled HTTP/2 client, and each day's fares are yielded
+    in date order as soon as they are available. Only a window of `max_workers`
+    days ahead of the one being yielded is submitted at a time, so at most that
+    many finished days' fares are held while waiting for an earlier day.
 
     Args:
         origin_iata (str): IATA code of the origin airport (e.g., "STN").
         start_date (str): Start date in "YYYY-MM-DD" format.
         end_date (str): End date in "YYYY-MM-DD" format.
         currency (str): Currency code for prices (e.g., "EUR", "GBP").
+        max_workers (int): Maximum number of days fetched concurrently.
 
-    Returns:
-        list: A list of fare objects returned by the Ryanair API. 
-              Each item typically contains:
-              - `outbound` (dict): Departure/arrival airport and time.
-              - `summary` (dict): Price and fare details.
+    Yields:
+        Fare: The fares returned by the Ryanair API.
 
     Raises:
-        requests.exceptions.RequestException: If the API request fails.
         ValueError: If the date format is invalid.
     """
-    url = "https://www.ryanair.com/api/farfnd/3/oneWayFares"
-
-    params = {
-        "departureAirportIataCode": origin_iata,
-        "outboundDepartureDateFrom": start_date,
-        "outboundDepartureDateTo": end_date,
-        "currency": currency
-    }
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-        "Accept": "application/json"
-    }
-
     current_date = datetime.strptime(start_date, "%Y-%m-%d")
     end_date = datetime.strptime(end_date, "%Y-%m-%d")
-    all_fares = []
 
+    dates = []
     while current_date <= end_date:
-        date_str = current_date.strftime("%Y-%m-%d")
-
-        url = "https://www.ryanair.com/api/farfnd/v4/oneWayFares"
-        params = {
-            "departureAirportIataCode": origin_iata,
-            "outboundDepartureDateFrom": date_str,
-            "outboundDepartureDateTo": date_str,
-            "market": "en-gb"
-        }
-        headers = {"User-Agent": "Mozilla/5.0"}
-
-        try:
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            all_fares += response.json().get("fares", [])
-        except Exception as e:
-            print(f"Error fetching fares for {date_str}: {e}")
-
+        dates.append(current_date.strftime("%Y-%m-%d"))
         current_date += timedelta(days=1)
 
-    return all_fares
-
-
-def get_singular_ryanair_return_flight(departure_flight, currency):
+    pending = iter(dates)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque()
+        for date_str in pending:
+            futures.append((date_str, executor.submit(
+                get_ryanair_day_fares, origin_iata, date_str, currency)))
+            if len(futures) == max_workers:
+                break
+
+        while futures:
+            date_str, future = futures.popleft()
+            next_date = next(pending, None)
+            if next_date is not None:
+                futures.append((next_date, executor.submit(
+                    get_ryanair_day_fares, origin_iata, next_date, currency)))
+            try:
+                fares = future.result()
+            except Exception as e:
+                log.warning("Error fetching fares for %s: %s", date_str, e)
+                continue
+            yield from fares
+
+
+async def get_singular_ryanair_return_flight(client, departure_flight, currency):
     """
     Finds a single suitable return flight from Ryanair for a given outbound flight.
 
     Parameters:
-        departure_flight (dict): Dictionary containing outbound flight details, 
-                                 expected to have keys:
-                                 - 'outbound' -> 'arrivalDate' (str, ISO format)
-                                 - 'outbound' -> 'departureDate' (str, ISO format)
-                                 - 'outbound' -> 'departureAirport' -> 'iataCode' (str)
-                                 - 'outbound' -> 'arrivalAirport' -> 'iataCode' (str)
+        client (httpx.AsyncClient): Client used to query the Ryanair API.
+        departure_flight (Fare): The outbound flight.
         currency (str): Currency code for flight prices (e.g., "EUR", "GBP").
 
     Returns:
-        dict or None: The first matching return flight as a dictionary if found, 
+        Fare or None: The first matching return flight if found, 
                       or None if no suitable return flight is available.
 
     Notes:
         - Only considers return flights on the same day as the arrival of the outbound flight.
-        - Filters for return flights departing at least 6 hours after the outbound arrival.
         - If the API returns a 400 error or no flights are found, returns None.
+        - Connection errors, 429s and 5xx responses are retried with exponential backoff,
+          up to `MAX_ATTEMPTS` attempts; if all fail, a warning is logged and None returned.
+        - Successful lookups are cached in Redis for `RETURN_CACHE_TTL` seconds.
+        - Does not check that the outbound flight departs and arrives on the same day;
+          see `extreme_day_trip_finder`.
     """
 
-    arrival_date_outbound = departure_flight["outbound"]["arrivalDate"]
-    date_only = datetime.strptime(
-        arrival_date_outbound, "%Y-%m-%dT%H:%M:%S").strftime("%Y-%m-%d")
-    departure_outbound_time = datetime.strptime(
-        departure_flight["outbound"]["departureDate"], "%Y-%m-%dT%H:%M:%S").strftime("%Y-%m-%d")
-    if departure_outbound_time != date_only:
-        return None
-
-    dt = datetime.strptime(arrival_date_outbound, "%Y-%m-%dT%H:%M:%S")
-
-    min_time_raw = dt + timedelta(hours=6)
-    max_time_raw = dt.replace(hour=23, minute=59, second=59)
+    dt = departure_flight.outbound.arrivalDate
+    date_only = dt.date().isoformat()
 
-    destination_iata = departure_flight["outbound"]["departureAirport"]["iataCode"]
-    origin_iata = departure_flight["outbound"]["arrivalAirport"]["iataCode"]
+    destination_iata = departure_flight.outbound.departureAirport.iataCode
+    origin_iata = departure_flight.outbound.arrivalAirport.iataCode
 
     url = "https://www.ryanair.com/api/farfnd/3/oneWayFares"
     params = {
@@ -115,33 +286,76 @@ def get_singular_ryanair_return_flight(departure_flight, currency):
         "outboundDepartureDateTo": date_only,
         "currency": currency
     }
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-        "Accept": "application/json"
-    }
 
-    response = requests.get(url, params=params, headers=headers)
-
-    if response.status_code == 400:
-        return None
+    @_retry
+    async def fetch():
+        response = await client.get(url, params=params)
+        if response.status_code == 400:
+            return None
+        response.raise_for_status()
+        return msgspec.json.decode(response.content, type=FareResponse).fares
 
+    key = f"rya:ret:{origin_iata}:{destination_iata}:{date_only}:{currency}"
     try:
-        return response.json()["fares"][0]
-    except:
+        return_flights = await cached_get_json_async(key, RETURN_CACHE_TTL, fetch)
+    except Exception as e:
+        log.warning("Error fetching return flights %s-%s for %s: %s",
+                    origin_iata, destination_iata, date_only, e)
         return None
 
+    return return_flights[0] if return_flights else None
+
+
+async def gather_return_flights(departure_flights, currency):
+    """
+    Looks up the return flight for every outbound flight concurrently.
+
+    Parameters:
+        departure_flights (list): Outbound flights as returned by `get_ryanair_flights`.
+        currency (str): Currency code for flight prices (e.g., "EUR", "GBP").
+
+    Returns:
+        list: The result of `get_singular_ryanair_return_flight` for each outbound
+              flight, in the same order as `departure_flights`.
 
-def find_suitable_flights(departure_flight):
+    Notes:
+        - Outbound flights to the same destination on the same day share a single
+          lookup, and therefore the same return flight.
+        - All lookups share one HTTP/2 client limited to `MAX_CONNECTIONS` connections,
+          which honours the API's HTTP caching headers.
+    """
+    by_route = defaultdict(list)
+    for i, departure_flight in enumerate(departure_flights):
+        outbound = departure_flight.outbound
+        by_route[(outbound.arrivalAirport.iataCode, outbound.arrivalDate.date())].append(i)
+
+    async with hishel.AsyncCacheClient(
+        storage=hishel.AsyncFileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL),
+        http2=True,
+        timeout=10.0,
+        headers=HEADERS,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS)
+    ) as client:
+        route_returns = await asyncio.gather(*[
+            get_singular_ryanair_return_flight(client, departure_flights[indices[0]], currency)
+            for indices in by_route.values()
+        ])
+
+    return_flights = [None] * len(departure_flights)
+    for indices, return_flight in zip(by_route.values(), route_returns):
+        for i in indices:
+            return_flights[i] = return_flight
+    return return_flights
+
+
+def find_suitable_flights(departure_flight, return_flight):
     """
-    Finds a suitable return flight for a given outbound Ryanair flight and calculates the total price.
+    Checks a return flight against a given outbound Ryanair flight and calculates the total price.
 
     Parameters:
-        departure_flight (dict): Dictionary containing outbound flight details, expected to have keys:
-                                 - 'outbound' -> 'departureAirport' -> 'iataCode', 'name'
-                                 - 'outbound' -> 'arrivalAirport' -> 'iataCode', 'name'
-                                 - 'outbound' -> 'departureDate' (str, ISO format)
-                                 - 'outbound' -> 'arrivalDate' (str, ISO format)
-                                 - 'outbound' -> 'price' -> 'value', 'currencyCode'
+        departure_flight (Fare): The outbound flight.
+        return_flight (Fare or None): The matching return flight, as found by
+                                      `get_singular_ryanair_return_flight`.
 
     Returns:
         tuple or None: A tuple (departure_flight, return_flight, total_price) if a suitable return flight is found,
@@ -151,38 +365,19 @@ def find_suitable_flights(departure_flight):
                            - The layover between outbound arrival and return departure is less than 4 hours
 
     Notes:
-        - Uses `get_singular_ryanair_return_flight` to fetch the return flight.
         - Assumes currency conversion or consistency is handled outside this function.
-        - Calculates layover in hours to filter flights that are too close.
+        - Compares the layover against `MIN_LAYOVER` to filter flights that are too close.
     """
 
-    origin_iata = departure_flight["outbound"]["departureAirport"]["iataCode"]
-    origin_name = departure_flight["outbound"]["departureAirport"]["name"]
-    destination_iata = departure_flight["outbound"]["arrivalAirport"]["iataCode"]
-    destination_name = departure_flight["outbound"]["departureAirport"]["name"]
-
-    departure_date_depart = departure_flight["outbound"]["departureDate"]
-    arrival_date_depart = departure_flight["outbound"]["arrivalDate"]
-    price_departure = departure_flight["outbound"]["price"]["value"]
-    currency = departure_flight["outbound"]["price"]["currencyCode"]
-
-    return_flight = get_singular_ryanair_return_flight(departure_flight, "EUR")
     if return_flight is None:
         return None
 
-    departure_date_return = return_flight["outbound"]["departureDate"]
-    arrival_date_return = return_flight["outbound"]["arrivalDate"]
-    price_return = return_flight["outbound"]["price"]["value"]
-    currency = return_flight["outbound"]["price"]["currencyCode"]
-
-    dt1 = datetime.fromisoformat(arrival_date_depart)
-    dt2 = datetime.fromisoformat(departure_date_return)
-    delta = dt2 - dt1
-    difference = delta.total_seconds() / 3600
-    if difference < 4:
+    outbound = departure_flight.outbound
+    inbound = return_flight.outbound
+    if inbound.departureDate - outbound.arrivalDate < MIN_LAYOVER:
         return None
 
-    total_price = price_departure + price_return
+    total_price = outbound.price.value + inbound.price.value
     return departure_flight, return_flight, total_price
 
 
@@ -197,109 +392,144 @@ def extreme_day_trip_finder(origin_iata, budget, date_start, date_end):
         date_end (str): End date for searching flights in "YYYY-MM-DD" format.
 
     Returns:
-        dict: A dictionary keyed by destination airport names, where each value is another dictionary containing:
+        list: A list of up to `MAX_RESULTS` (destination_name, trip) tuples for the cheapest
+              destinations, sorted by total price in ascending order, where destination_name
+              is the destination airport name and trip is a dictionary containing:
             - "departures": outbound flight information (dict)
             - "returns": return flight information (dict)
             - "price": total round-trip price (float, rounded to 2 decimal places)
 
-        The dictionary is sorted by total price in ascending order.
-
     Notes:
         - Uses `get_ryanair_flights` to fetch outbound flights.
-        - Uses `find_suitable_flights` to find matching return flights on the same day.
+        - Uses `gather_return_flights` to look up return flights on the same day concurrently,
+          and `find_suitable_flights` to check each pair.
         - Filters out flights exceeding the budget or with unsuitable layover times.
-        - Dates in the returned dictionary are formatted using `nice_date_format`.
-        - Prints flight details and total flights found for debugging/inspection.
+          Outbound flights that alone use up the budget, or that do not arrive on the day they
+          depart, are dropped before any return lookup.
+        - Flights in the returned list are converted with `display_flight`.
+        - Logs flight details at DEBUG level for debugging/inspection.
     """
 
-    total = 0
+    budget = float(budget)
 
-    record = get_ryanair_flights(origin_iata, date_start, date_end, "GBP")
+    record = []
+    for departure_flight in get_ryanair_flights(origin_iata, date_start, date_end, "GBP"):
+        outbound = departure_flight.outbound
+        if outbound.price.value >= budget:
+            continue
+        if outbound.departureDate.date() != outbound.arrivalDate.date():
+            continue
+        record.append(departure_flight)
+    return_flights = asyncio.run(gather_return_flights(record, "EUR"))
     actual_dict = {}
-    for departure_flight in record:
-
-        origin_iata = departure_flight["outbound"]["departureAirport"]["iataCode"]
-        origin_name = departure_flight["outbound"]["departureAirport"]["name"]
-        destination_iata = departure_flight["outbound"]["arrivalAirport"]["iataCode"]
-        destination_name = departure_flight["outbound"]["arrivalAirport"]["name"]
+    for departure_flight, return_flight in zip(record, return_flights):
 
-        departure_date_depart = departure_flight["outbound"]["departureDate"]
-        arrival_date_depart = departure_flight["outbound"]["arrivalDate"]
-        price_departure = departure_flight["outbound"]["price"]["value"]
-        currency = departure_flight["outbound"]["price"]["currencyCode"]
-
-        result = find_suitable_flights(departure_flight)
-
-        departure_date_depart = departure_flight["outbound"]["departureDate"] = nice_date_format(
-            departure_flight["outbound"]["departureDate"])
-        arrival_date_depart = departure_flight["outbound"]["arrivalDate"] = nice_date_format(
-            departure_flight["outbound"]["arrivalDate"])
+        result = find_suitable_flights(departure_flight, return_flight)
         if result is None:
-
             continue
-        else:
-            depart1, return_flight, price = result
 
-        departure_date_return = return_flight["outbound"]["departureDate"] = nice_date_format(
-            return_flight["outbound"]["departureDate"])
-        arrival_date_return = return_flight["outbound"]["arrivalDate"] = nice_date_format(
-            return_flight["outbound"]["arrivalDate"])
-        price_return = return_flight["outbound"]["price"]["value"]
-        currency = return_flight["outbound"]["price"]["currencyCode"]
+        depart1, return_flight, price = result
+        if price > budget:
+            continue
 
-        if depart1 is None or return_flight is None:
+        outbound = departure_flight.outbound
+        inbound = return_flight.outbound
+        origin_name = outbound.departureAirport.name
+        destination_name = outbound.arrivalAirport.name
 
-            continue
+        actual_dict[destination_name] = {
+            "departures": depart1,
+            "returns": return_flight,
+            "price": round(price, 2)
+        }
 
-        if price > float(budget):
-            continue
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Flight: depart %s, arrive %s, depart at time %s, arrive at time %s; "
+                "depart %s, arrive %s, depart at time %s, arrive at time %s; total cost EUR%s",
+                origin_name, destination_name,
+                nice_date_format(outbound.departureDate), nice_date_format(outbound.arrivalDate),
+                destination_name, origin_name,
+                nice_date_format(inbound.departureDate), nice_date_format(inbound.arrivalDate),
+                price)
+
+    sorted_items = [
+        (destination_name, {
+            "departures": display_flight(trip["departures"]),
+            "returns": display_flight(trip["returns"]),
+            "price": trip["price"]
+        })
+        for destination_name, trip in heapq.nsmallest(
+            MAX_RESULTS, actual_dict.items(), key=lambda x: x[1]["price"])
+    ]
+
+    return sorted_items
+
+
+@lru_cache(maxsize=4096)
+def nice_date_format(date):
+    """
+    Converts a datetime into a human-readable format.
 
-        actual_dict[destination_name] = {}
+    Results are cached, as many flights share the same departure and arrival times.
 
-        actual_dict[destination_name]["departures"] = depart1
+    Parameters:
+        date (datetime): The datetime to format, e.g., datetime(2025, 8, 20, 19, 5).
 
-        actual_dict[destination_name]["returns"] = return_flight
-        actual_dict[destination_name]["price"] = round(price, 2)
+    Returns:
+        str: A formatted date string in the form "DD Month YYYY, HH:MM" (24-hour time),
+             e.g., "20 August 2025, 19:05".
+    """
+    return date.strftime("%d %B %Y, %H:%M")
 
-        print("Flight")
 
-        print(f"Depart {origin_name}, arrive {destination_name}, depart at time {
-              departure_date_depart}, arrive at time {arrival_date_depart}")
-        print(f"Depart {destination_name}, arrive {origin_name}, depart at time {
-              departure_date_return}, arrive at time {arrival_date_return}")
-        print(f"Total cost EUR{price}")
-        total += 1
+def display_flight(fare):
+    """
+    Converts a fare into the plain dictionary shown on the results page.
 
-    sorted_dict = {k: v for k, v in sorted(
-        actual_dict.items(), key=lambda x: x[1]["price"])}
+    Parameters:
+        fare (Fare): The flight to convert.
 
-    return sorted_dict
+    Returns:
+        dict: The fare's fields as nested dictionaries, with 'outbound' -> 'departureDate'
+              and 'outbound' -> 'arrivalDate' formatted using `nice_date_format`.
+    """
+    flight = msgspec.to_builtins(fare)
+    flight["outbound"]["departureDate"] = nice_date_format(fare.outbound.departureDate)
+    flight["outbound"]["arrivalDate"] = nice_date_format(fare.outbound.arrivalDate)
+    return flight
 
 
-def nice_date_format(date):
+@lru_cache(maxsize=None)
+def load_iata_by_name(csv_filepath_iata):
     """
-    Converts an ISO 8601 datetime string into a human-readable format.
+    Reads an airports CSV file once into a lookup table from airport name to IATA code.
 
     Parameters:
-        date (str): A date string in ISO 8601 format, e.g., "2025-08-20T19:05:00".
+        csv_filepath_iata (str): Path to a CSV file containing airport data 
+                                 with at least 'name' and 'iata_code' columns.
 
     Returns:
-        str: A formatted date string in the form "DD Month YYYY, HH:MM" (24-hour time),
-             e.g., "20 August 2025, 19:05".
-             If the input is invalid or cannot be parsed, returns None.
+        dict: Maps each airport name to the IATA code of the first row with that name.
     """
-    try:
-        dt = datetime.fromisoformat(date)
-        nice_format = dt.strftime("%d %B %Y, %H:%M")
-        return nice_format
-    except (ValueError, TypeError):
-        return None
+    iata_by_name = {}
+    with open(csv_filepath_iata, mode="r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            iata_by_name.setdefault(row["name"], row["iata_code"])
+
+    return iata_by_name
 
 
+@lru_cache(maxsize=1)
 def get_ryanair_airports(csv_filepath_ryanair, csv_filepath_iata):
     """
     Reads two CSV files to return a list of Ryanair airports with full details.
 
+    The small Ryanair file is read first, so only the matching rows of the
+    (much larger) airports file are kept. The result is cached, so the files
+    are only read on the first call.
+
     Parameters:
         csv_filepath_ryanair (str): Path to a CSV file containing Ryanair airport IATA codes.
         csv_filepath_iata (str): Path to a CSV file containing detailed airport info
@@ -313,29 +543,25 @@ def get_ryanair_airports(csv_filepath_ryanair, csv_filepath_iata):
                       - 'country': ISO country code
                       Only airports present in both CSV files are returned.
     """
+    with open(csv_filepath_ryanair, mode="r", encoding="utf-8") as f:
+        ryanair_iatas = [row["iata_code"] for row in csv.DictReader(f)]
+    wanted = set(ryanair_iatas)
+
     airports = {}
     with open(csv_filepath_iata, mode="r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             iata = row["iata_code"]
-            name = row["name"]
-            city = row["municipality"]
-            country = row["iso_country"]
+            if iata not in wanted:
+                continue
             airports[iata] = {
                 "code": iata,
-                "name": name,
-                "city": city,
-                "country": country
+                "name": row["name"],
+                "city": row["municipality"],
+                "country": row["iso_country"]
             }
 
-    airports_of_interest = []
-    with open(csv_filepath_ryanair, mode="r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["iata_code"] in airports:
-                airports_of_interest.append(airports[row["iata_code"]])
-
-    return airports_of_interest
+    return [airports[iata] for iata in ryanair_iatas if iata in airports]
 
 
 def get_iata(origin_name, csv_filepath_iata):
@@ -350,9 +576,4 @@ def get_iata(origin_name, csv_filepath_iata):
     Returns:
         str or None: The IATA code if a match is found, otherwise None.
     """
-    with open(csv_filepath_iata, mode="r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["name"] == origin_name:
-                return row["iata_code"]
-    return None
+    return load_iata_by_name(csv_filepath_iata).get(origin_name)
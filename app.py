@@ -3,12 +3,30 @@ from flask import Flask, render_template, request
 from main import extreme_day_trip_finder
 from main import get_ryanair_airports
 from main import get_iata
+from main import load_iata_by_name
 from flask import session
 from math import ceil
+import logging
+import os
+import uuid
+import orjson
+import redis
+
+RESULTS_TTL = 900
+PER_PAGE = 10
+
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING"))
+
+log = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.secret_key = "xxxx"
 
+_redis = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+
+RYANAIR_AIRPORTS = get_ryanair_airports("ryanair_airports.csv", "airports.csv")
+load_iata_by_name("airports.csv")
+
 
 @app.route("/", methods=["GET", "POST"])
 def index():
@@ -22,34 +40,60 @@ def index():
 
         iata = get_iata(origin_name, "airports.csv")
 
-        results_dict = extreme_day_trip_finder(
+        try:
+            _redis.ping()
+        except redis.RedisError as e:
+            log.warning("Redis unavailable, not running search: %s", e)
+            return results_unavailable()
+
+        sorted_items = extreme_day_trip_finder(
             iata, budget, date_start, date_end)
-        session["flight_results"] = results_dict
+        results_id = uuid.uuid4().hex
+        if sorted_items:
+            key = f"session:{results_id}:results"
+            try:
+                pipe = _redis.pipeline()
+                pipe.rpush(key, *[orjson.dumps(item) for item in sorted_items])
+                pipe.expire(key, RESULTS_TTL)
+                pipe.execute()
+            except redis.RedisError as e:
+                log.warning("Could not store search results: %s", e)
+                return results_unavailable()
+        session["results_id"] = results_id
         return redirect(url_for("search", page=1))
 
-    ryanair_airports = get_ryanair_airports(
-        "ryanair_airports.csv", "airports.csv")
-
-    return render_template("index.html", ryanair_airports=ryanair_airports)
+    return render_template("index.html", ryanair_airports=RYANAIR_AIRPORTS)
 
 
 @app.route("/search")
 def search():
 
-    page = int(request.args.get("page", 1))
+    page = max(int(request.args.get("page", 1)), 1)
 
-    results = session.get("flight_results", [])
-    per_page = 10
-    results_list = list(results.items())
-    shown = results_list[(page-1) * per_page: (page) * per_page]
+    shown = []
+    total = 0
+    results_id = session.get("results_id")
+    if results_id is not None:
+        key = f"session:{results_id}:results"
+        try:
+            pipe = _redis.pipeline()
+            pipe.lrange(key, (page-1) * PER_PAGE, page * PER_PAGE - 1)
+            pipe.llen(key)
+            blobs, total = pipe.execute()
+        except redis.RedisError as e:
+            log.warning("Could not load search results: %s", e)
+            return results_unavailable()
+        shown = [orjson.loads(blob) for blob in blobs]
 
-    return render_template("result.html", results=shown, page=page, total_pages=ceil(len(results)/10))
+    return render_template("result.html", results=shown, page=page, total_pages=ceil(total/PER_PAGE))
 
 
-@app.template_filter('sort_by_price')
-def sort_by_price_filter(value):
-    return sorted(value, key=lambda x: x[1]["price"])
+def results_unavailable():
+    """
+    Renders the results page with an error message, for when Redis cannot be reached.
+    """
+    return render_template("result.html", results=[], page=1, total_pages=0, unavailable=True), 503
 
 
-if __name__ == "__main__":
+if __name__ == "__main__" and os.getenv("FLASK_DEV"):
     app.run(debug=True)
@@ -0,0 +1,7 @@
+import os
+
+bind = os.getenv("BIND", "127.0.0.1:8000")
+workers = 4
+threads = 16
+worker_class = "gthread"
+timeout = 120